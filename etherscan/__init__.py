@@ -1,2 +1,3 @@
 """Etherscan API wrapper main package."""
-from .etherscan import Etherscan
+from .__version__ import __version__
+from .etherscan import AccountQuery, Etherscan
@@ -0,0 +1,320 @@
+"""Asynchronous Etherscan API wrapper."""
+import asyncio
+import contextlib
+import random
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
+
+import aiohttp
+import requests
+
+from .cache import RedisCache, TTLCache
+from .etherscan import Etherscan, ijson
+from .utils import chunks, clean_params, loads
+
+
+class _AsyncRecordingReader:
+    """Async version of `_RecordingReader`, over an async file-like body."""
+
+    __slots__ = ("_file", "_chunks")
+
+    def __init__(self, file: Any):
+        self._file = file
+        self._chunks: Optional[List[bytes]] = []
+
+    async def read(self, size: int = -1) -> bytes:
+        data = await self._file.read(size)
+        if self._chunks is not None:
+            self._chunks.append(data)
+        return data
+
+    def stop(self):
+        self._chunks = None
+
+    def getvalue(self) -> Optional[bytes]:
+        """Get the recorded bytes, None once stopped."""
+        return None if self._chunks is None else b"".join(self._chunks)
+
+
+class AsyncEtherscan(Etherscan):
+    """Asynchronous Etherscan API wrapper.
+
+    Provides the same methods as `Etherscan`, each returning an awaitable,
+    or an async iterator for the `iter_*` methods.
+    At most `concurrency` requests are in flight at the same time.
+    The cache backends are synchronous, a `RedisCache` blocks the event
+    loop during its round trips, prefer the in-memory cache.
+
+    async with AsyncEtherscan(key="<your-key-here>") as es:
+        await es.get_gas_oracle()
+    """
+
+    __slots__ = ("concurrency", "_sem", "_url")
+
+    # Upper bound in seconds of the delay between two retries
+    RETRY_BACKOFF_MAX = 8
+    # Transport errors retried like RETRY_STATUSES
+    RETRY_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+    def __init__(
+        self,
+        key: str,
+        plan: str = "free",
+        fail_silently: bool = False,
+        cache: Union[bool, TTLCache, RedisCache] = False,
+        max_retries: int = 5,
+        concurrency: int = 5,
+        rate_limit: Optional[float] = None,
+    ):
+        self.concurrency = concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        # the apikey is only encoded once, like in the sync request template
+        self._url = f"{self.BASE_URL}?{urlencode({'apikey': key})}"
+        super().__init__(
+            key=key,
+            plan=plan,
+            fail_silently=fail_silently,
+            cache=cache,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+        )
+
+    def __enter__(self):
+        raise TypeError(
+            "AsyncEtherscan must be used with `async with AsyncEtherscan()`"
+        )
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            headers={"User-Agent": self.USER_AGENT},
+            connector=aiohttp.TCPConnector(limit_per_host=self.concurrency),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.TIMEOUT[0], sock_read=self.TIMEOUT[1]
+            ),
+        )
+        self._sem = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _create_session(self) -> None:
+        """The aiohttp session is created inside the running event loop."""
+        return None
+
+    def _create_template(self) -> Tuple[None, Dict[str, Any]]:
+        """The URL holding the apikey replaces the requests template."""
+        return None, {}
+
+    async def close(self):
+        """Close the underlying session and release its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _check_session(self):
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncEtherscan must be used with `async with AsyncEtherscan()`"
+            )
+
+    def _build_url(self, params: Optional[Dict[str, Any]]) -> str:
+        """Append the encoded params to the URL holding the apikey."""
+        if not params:
+            return self._url
+        return f"{self._url}&{urlencode(params)}"
+
+    async def _get(self, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Get requests to the specified path on Etherscan API."""
+        self._check_session()
+
+        params = clean_params(params)
+
+        cached = self._from_cache(params)
+        if cached is not None:
+            return cached
+
+        url = self._build_url(params)
+
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self._bucket.reserve())
+            try:
+                r = await self._request(url)
+            except self.RETRY_ERRORS:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            if r.status_code == 200:
+                return self._to_cache(params, loads(r.content))
+
+            if (
+                attempt == self.max_retries
+                or r.status_code not in self.RETRY_STATUSES
+            ):
+                break
+            await asyncio.sleep(
+                self._retry_delay(attempt, r.headers.get("Retry-After"))
+            )
+
+        self._fail(r, params)
+
+    async def _get_stream(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the result list of a request to Etherscan API.
+
+        Large responses are parsed incrementally with ijson, when installed,
+        like in sync. Failed attempts are retried until an item is yielded.
+        """
+        self._check_session()
+
+        params = clean_params(params)
+        url = self._build_url(params)
+
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self._bucket.reserve())
+            yielded = False
+            try:
+                async with self._open_stream(url) as (status, headers, body):
+                    if status == 200:
+                        async for item in self._iter_result(
+                            headers, body, params
+                        ):
+                            yielded = True
+                            yield item
+                        return
+                    content = await body.read()
+            except self.RETRY_ERRORS:
+                if yielded or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            r = self._to_response(status, headers, url, content)
+            if attempt == self.max_retries or status not in self.RETRY_STATUSES:
+                break
+            await asyncio.sleep(
+                self._retry_delay(attempt, headers.get("Retry-After"))
+            )
+
+        self._fail(r, params)
+
+    async def _iter_result(
+        self,
+        headers: Mapping[str, str],
+        body: Any,
+        params: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the result list of a successful response body."""
+        size = headers.get("Content-Length")
+        if ijson is None or (size and int(size) < self.STREAM_MIN_SIZE):
+            for item in self._result_list(loads(await body.read()), params):
+                yield item
+            return
+
+        body = _AsyncRecordingReader(body)
+        async for item in ijson.items(body, "result.item", use_float=True):
+            # the result is a list, the body doesn't need to be kept
+            body.stop()
+            yield item
+        content = body.getvalue()
+        if content is not None:
+            # no item, an empty list or an error message
+            self._result_list(loads(content), params)
+
+    @contextlib.asynccontextmanager
+    async def _open_stream(self, url: str):
+        """Send a streamed request, yield its status, headers and body.
+
+        The body is an async file-like object, read with `await body.read()`.
+        """
+        async with self._sem:
+            async with self._session.get(url) as r:
+                yield r.status, r.headers, r.content
+
+    async def batch_get(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """Send several requests concurrently, bounded by `concurrency`.
+
+        Returns the responses in the order of `calls`.
+        """
+        return list(await asyncio.gather(*(self._get(p) for p in calls)))
+
+    async def gather(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several methods concurrently, bounded by `concurrency`.
+
+        Returns the responses in the order of `calls`.
+        """
+        methods = [self._gather_method(name) for name, _ in calls]
+        return list(
+            await asyncio.gather(
+                *(
+                    method(**kwargs)
+                    for method, (_, kwargs) in zip(methods, calls)
+                )
+            )
+        )
+
+    async def get_balances(
+        self, addresses: List[str], tag: str = "latest"
+    ) -> List[Dict[str, str]]:
+        """Get the balance of the accounts of any number of addresses.
+
+        The batches of 20 addresses are requested concurrently.
+        """
+        batches = chunks(addresses, self.BALANCE_MULTI_SIZE)
+        return self._merge_balances(
+            batches,
+            await asyncio.gather(
+                *(
+                    self.get_balance_multiple_addresses(address=chunk, tag=tag)
+                    for chunk in batches
+                )
+            ),
+        )
+
+    async def _request(self, url: str) -> requests.Response:
+        """Send a single request and read its response."""
+        async with self._sem:
+            async with self._session.get(url) as r:
+                return self._to_response(
+                    r.status, r.headers, str(r.url), await r.read()
+                )
+
+    def _retry_delay(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> float:
+        """Get the seconds to wait before retrying a failed request."""
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        # exponential backoff with full jitter
+        return random.uniform(
+            0, min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF * 2**attempt)
+        )
+
+    @staticmethod
+    def _to_response(
+        status: int, headers: Mapping[str, str], url: str, content: bytes
+    ) -> requests.Response:
+        """Build a requests response, so errors are handled like in sync."""
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.url = url
+        response._content = content
+        return response
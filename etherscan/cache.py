@@ -0,0 +1,102 @@
+"""Response caches."""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from urllib.parse import urlencode
+
+from .utils import dumps, loads
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Values are stored serialized, so each `get` returns a new copy that
+    callers can modify without altering the cache.
+
+    maxsize : the maximum number of entries, least recently used ones
+    are evicted first
+    ttl : the default number of seconds an entry stays fresh
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value of a fresh entry, or `default`."""
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return loads(value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value for `ttl` seconds, `math.inf` never expires."""
+        if ttl is None:
+            ttl = self.ttl
+        value = dumps(value)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache:
+    """Response cache stored in Redis, shared between processes.
+
+    client : the `redis.Redis` client to store the entries with
+    ttl : the default number of seconds an entry stays fresh
+    prefix : the string prepended to the Redis keys
+    """
+
+    __slots__ = ("client", "ttl", "prefix")
+
+    def __init__(
+        self, client: Any, ttl: float = 300, prefix: str = "etherscan:"
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, key: Tuple[Tuple[str, Any], ...]) -> str:
+        return self.prefix + urlencode(key)
+
+    def get(self, key: Tuple[Tuple[str, Any], ...], default: Any = None) -> Any:
+        """Get the value of a fresh entry, or `default`."""
+        value = self.client.get(self._key(key))
+        return default if value is None else loads(value)
+
+    def set(
+        self,
+        key: Tuple[Tuple[str, Any], ...],
+        value: Any,
+        ttl: Optional[float] = None,
+    ):
+        """Store a value for `ttl` seconds, `math.inf` never expires."""
+        if ttl is None:
+            ttl = self.ttl
+        self.client.set(
+            self._key(key),
+            dumps(value),
+            px=None if math.isinf(ttl) else max(1, int(ttl * 1000)),
+        )
@@ -1,22 +1,99 @@
 """Etherscan API wrapper."""
 import logging
-from typing import Any, Dict, List, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
-from .utils import clean_params
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+from .__version__ import __version__
+from .cache import RedisCache, TTLCache
+from .ratelimit import TokenBucket
+from .utils import chunks, clean_params, loads, merge_results
 
 logger = logging.getLogger(__name__)
 
 
 class EtherscanAPIError(Exception):
-    def __init__(self, response, message=""):
+    # Maximum number of bytes of the response body shown in the message
+    PREVIEW_SIZE = 1024
+
+    def __init__(self, response=None, message=""):
         super().__init__(message)
         self.response = response
         self.message = message
+        if response is None:
+            # the request succeeded, but the API returned an error message
+            self.status_code = None
+            self._preview = message
+            return
+        self.status_code = response.status_code
+        # decoded straight from a view, the slice of the body isn't copied
+        self._preview = str(
+            memoryview(response.content)[: self.PREVIEW_SIZE],
+            "utf-8",
+            "replace",
+        )
 
     def __str__(self):
-        return f"{self.response.status_code} {self.response.content.decode()}"
+        if self.status_code is None:
+            return self._preview
+        return f"{self.status_code} {self._preview}"
+
+
+class AccountQuery(NamedTuple):
+    """Arguments of an account balance query, reusable between calls."""
+
+    address: str
+    tag: str = "latest"
+
+
+class _RecordingReader:
+    """File-like object recording the bytes read until `stop` is called.
+
+    Keeps the body of a streamed response that yielded no item, to tell an
+    empty result list from an error message once it is parsed.
+    """
+
+    __slots__ = ("_file", "_chunks")
+
+    def __init__(self, file: Any):
+        self._file = file
+        self._chunks: Optional[List[bytes]] = []
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        if self._chunks is not None:
+            self._chunks.append(data)
+        return data
+
+    def stop(self):
+        self._chunks = None
+
+    def getvalue(self) -> Optional[bytes]:
+        """Get the recorded bytes, None once stopped."""
+        return None if self._chunks is None else b"".join(self._chunks)
 
 
 class Etherscan:
@@ -25,93 +102,450 @@ class Etherscan:
     https://etherscan.io/
     """
 
+    __slots__ = (
+        "_key",
+        "plan",
+        "fail_silently",
+        "max_retries",
+        "_bucket",
+        "_cache",
+        "_session",
+        "_owns_session",
+        "_template",
+        "_send_kwargs",
+    )
+
     # Mainnet endpoint
     BASE_URL = "https://api.etherscan.io/api"
+    USER_AGENT = f"py-etherscan-client/{__version__}"
+    HEADERS = {
+        # includes br when brotli is installed to decode it
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "User-Agent": USER_AGENT,
+    }
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (3.05, 30)
+    # Seconds a cached response stays fresh, by action
+    CACHE_TTL = {
+        "gasoracle": 5,
+        "eth_blockNumber": 5,
+        "eth_gasPrice": 5,
+        "ethprice": 30,
+        "getabi": math.inf,
+        "getsourcecode": math.inf,
+        "getblockreward": math.inf,
+        # countdowns, statuses and pending receipts are not cached
+        "getblockcountdown": 0,
+        "getstatus": 0,
+        "gettxreceiptstatus": 0,
+        "eth_getTransactionReceipt": 0,
+    }
+    CACHE_DEFAULT_TTL = 300
+    # Upper bound of the TTL of responses about the head of the chain
+    CACHE_LATEST_TAGS = ("latest", "pending")
+    CACHE_LATEST_TTL = 5
+    CACHE_MAXSIZE = 10_000
+    # Responses smaller than this many bytes are not worth parsing as a stream
+    STREAM_MIN_SIZE = 64 * 1024
+    # Statuses retried with an exponential backoff of RETRY_BACKOFF seconds
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_BACKOFF = 0.5
+    # Maximum number of addresses of a balancemulti call
+    BALANCE_MULTI_SIZE = 20
+    # Requests per second allowed by each API plan, overridden by rate_limit
+    RATE_LIMITS = {
+        "free": 5,
+        "standard": 10,
+        "advanced": 20,
+        "professional": 30,
+    }
 
     def __init__(
-        self, key: str, plan: str = "free", fail_silently: bool = False
+        self,
+        key: str,
+        plan: str = "free",
+        fail_silently: bool = False,
+        cache: Union[bool, TTLCache, RedisCache] = False,
+        max_retries: int = 5,
+        session: Optional[requests.Session] = None,
+        rate_limit: Optional[float] = None,
     ):
-        self.key = key
+        self._key = key
         self.plan = plan.lower()
+        if rate_limit is None:
+            if self.plan not in self.RATE_LIMITS:
+                logger.warning(
+                    "Unknown plan %s, using the rate limit of the free plan",
+                    plan,
+                )
+            rate_limit = self.RATE_LIMITS.get(
+                self.plan, self.RATE_LIMITS["free"]
+            )
+        elif rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, not {rate_limit}")
         self.fail_silently = fail_silently
+        self.max_retries = max_retries
+        self._bucket = TokenBucket(rate=rate_limit)
+        if cache is True:
+            cache = TTLCache(
+                maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_DEFAULT_TTL
+            )
+        elif cache is False:
+            cache = None
+        self._cache = cache
+        # a given session is configured and closed by the caller
+        self._owns_session = session is None
+        if session is None:
+            session = self._create_session()
+        self._session = session
+        self._template, self._send_kwargs = self._create_template()
+
+    @property
+    def key(self) -> str:
+        """The API key, read-only as the request template includes it."""
+        return self._key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session reusing connections between API calls."""
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=self.max_retries,
+                    backoff_factor=self.RETRY_BACKOFF,
+                    status_forcelist=self.RETRY_STATUSES,
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                    # hand the last response to _fail instead of raising
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        session.headers.update(self.HEADERS)
+        return session
+
+    def close(self):
+        """Close the underlying session and release its connections.
+
+        A session given to the constructor is left open.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def batch_get(
+        self, calls: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """Send several requests concurrently over the session pool.
+
+        calls : the params of each request, e.g.
+        `{"module": "proxy", "action": "eth_getTransactionByHash", ...}`
+        max_workers : the number of requests in flight at the same time,
+        defaults to the number of requests per second allowed
+
+        Returns the responses in the order of `calls`.
+        """
+        return self._run_concurrently(
+            [partial(self._get, params) for params in calls], max_workers
+        )
+
+    def gather(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Call several methods concurrently over the session pool.
+
+        calls : the method name and keyword arguments of each call, e.g.
+        `("get_balance_single_address", {"address": ..., "tag": "latest"})`
+        max_workers : the number of requests in flight at the same time,
+        defaults to the number of requests per second allowed
+
+        Returns the responses in the order of `calls`.
+        """
+        methods = [self._gather_method(name) for name, _ in calls]
+        return self._run_concurrently(
+            [
+                partial(method, **kwargs)
+                for method, (_, kwargs) in zip(methods, calls)
+            ],
+            max_workers,
+        )
+
+    def _gather_method(self, name: str) -> Callable:
+        """Get the `get_*` method called `name`, the ones gather can call."""
+        method = getattr(self, name, None) if name.startswith("get_") else None
+        if not callable(method):
+            raise ValueError(
+                f"{name!r} is not a get_* method of {type(self).__name__}"
+            )
+        return method
+
+    def _run_concurrently(
+        self,
+        calls: List[Callable[[], Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Run the calls on a pool of threads sharing the session.
+
+        max_workers defaults to the number of requests per second allowed.
+        Returns the results in the order of `calls`.
+        """
+        if max_workers is None:
+            max_workers = max(1, int(self._bucket.rate))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def _call(self, module: str, action: str, **params: Any) -> Any:
+        """Call an action of an Etherscan API module with the given params."""
+        # params is already a new dict, complete it rather than copying it
+        params["module"] = module
+        params["action"] = action
+        return self._get(params=params)
 
     def _get(self, params: Optional[Dict[str, Any]] = None) -> Any:
         """Get requests to the specified path on Etherscan API."""
-        if params is None:
-            params = {}
+        params = clean_params(params)
 
-        params.update({"apikey": self.key})
+        cached = self._from_cache(params)
+        if cached is not None:
+            return cached
 
-        r = requests.get(url=self.BASE_URL, params=clean_params(params))
+        request = self._prepare(params)
+        self._bucket.consume()
+        r = self._session.send(
+            request, timeout=self.TIMEOUT, **self._send_kwargs
+        )
 
         if r.status_code == 200:
-            return r.json()
+            return self._to_cache(params, loads(r.content))
 
         self._fail(r, params)
 
+    def _stream(self, module: str, action: str, **params: Any) -> Iterator:
+        """Iterate over the result list of an Etherscan API module action."""
+        params["module"] = module
+        params["action"] = action
+        return self._get_stream(params=params)
+
+    def _get_stream(self, params: Optional[Dict[str, Any]] = None) -> Iterator:
+        """Iterate over the result list of a request to Etherscan API.
+
+        Large responses are parsed incrementally with ijson, when installed,
+        so items are yielded while the body is still being downloaded.
+        An error message instead of the result list is handled like an HTTP
+        error, raised unless `fail_silently`.
+        """
+        params = clean_params(params)
+        request = self._prepare(params)
+        self._bucket.consume()
+        with self._session.send(
+            request,
+            timeout=self.TIMEOUT,
+            **{**self._send_kwargs, "stream": True},
+        ) as r:
+            if r.status_code != 200:
+                self._fail(r, params)
+                return
+
+            size = r.headers.get("Content-Length")
+            if ijson is None or (size and int(size) < self.STREAM_MIN_SIZE):
+                yield from self._result_list(loads(r.content), params)
+                return
+
+            r.raw.decode_content = True
+            body = _RecordingReader(r.raw)
+            for item in ijson.items(body, "result.item", use_float=True):
+                # the result is a list, the body doesn't need to be kept
+                body.stop()
+                yield item
+            content = body.getvalue()
+            if content is not None:
+                # no item, an empty list or an error message
+                self._result_list(loads(content), params)
+
+    def _create_template(
+        self,
+    ) -> Tuple[Optional[requests.PreparedRequest], Dict[str, Any]]:
+        """Prepare the request template holding the encoded apikey.
+
+        The session headers, apikey and environment settings (proxies,
+        certificates) are merged once, when the client is created, so
+        concurrent calls never see them half built.
+        """
+        template = self._session.prepare_request(
+            requests.Request(
+                "GET",
+                self.BASE_URL,
+                params={"apikey": self.key},
+                headers=self._default_headers(),
+            )
+        )
+        send_kwargs = self._session.merge_environment_settings(
+            template.url, {}, None, None, None
+        )
+        return template, send_kwargs
+
+    def _prepare(
+        self, params: Optional[Dict[str, Any]]
+    ) -> requests.PreparedRequest:
+        """Prepare a request from a copy of the template."""
+        request = self._template.copy()
+        if params:
+            request.url = f"{request.url}&{urlencode(params)}"
+        return request
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Get the `HEADERS` a given session left to the requests defaults.
+
+        They are sent with each request, the session itself isn't modified.
+        """
+        defaults = requests.utils.default_headers()
+        return {
+            name: value
+            for name, value in self.HEADERS.items()
+            if self._session.headers.get(name) == defaults.get(name)
+        }
+
+    def _from_cache(self, params: Optional[Dict[str, Any]]) -> Any:
+        """Get a fresh cached response for these params, if any."""
+        if self._cache is None:
+            return None
+        return self._cache.get(tuple(sorted((params or {}).items())))
+
+    def _to_cache(self, params: Optional[Dict[str, Any]], data: Any) -> Any:
+        """Cache a successful response for these params and return it."""
+        if self._cache is None:
+            return data
+        # Etherscan reports errors such as rate limiting with a "0" status,
+        # the proxy module with a JSON-RPC error
+        if isinstance(data, dict) and (
+            data.get("status") == "0" or "error" in data
+        ):
+            return data
+        params = params or {}
+        ttl = self.CACHE_TTL.get(params.get("action"))
+        if ttl == 0:
+            return data
+        if params.get("tag") in self.CACHE_LATEST_TAGS:
+            # balances, counts... at the latest block change with each block
+            ttl = min(ttl or self.CACHE_LATEST_TTL, self.CACHE_LATEST_TTL)
+        self._cache.set(tuple(sorted(params.items())), data, ttl=ttl)
+        return data
+
+    def _result_list(self, data: Any, params: Optional[Dict[str, Any]]) -> List:
+        """Get the result list of a response.
+
+        An error message (`"result": "Invalid API Key"`...) raises, or is
+        logged and gives an empty list with `fail_silently`.
+        """
+        result = data.get("result") if isinstance(data, dict) else None
+        if isinstance(result, list):
+            return result
+
+        error = EtherscanAPIError(message=f"{result}")
+        if not self.fail_silently:
+            logger.warning("Etherscan API error with %s: %s", params, error)
+            raise error
+        logger.info("Etherscan API silent error with %s: %s", params, error)
+        return []
+
     def _fail(self, r, params):
-        details = r.content.decode()
-        try:
-            details = r.json()
-        except Exception:
-            pass
+        # the error body is never parsed, only a bounded preview is kept
+        error = EtherscanAPIError(response=r)
 
         if not self.fail_silently:
-            logger.warning(
-                f"Etherscan API error {r.status_code} with {params} {details}"
-            )
-            raise EtherscanAPIError(response=r)
+            logger.warning("Etherscan API error with %s: %s", params, error)
+            raise error
 
-        logger.info(
-            f"Etherscan API silent error {r.status_code} with {params} "
-            f"{details}"
-        )
+        logger.info("Etherscan API silent error with %s: %s", params, error)
 
     def get_gas_oracle(self):
         """Get the current Safe, Proposed and Fast gas prices."""
-        return self._get(params={"module": "gastracker", "action": "gasoracle"})
+        return self._call("gastracker", "gasoracle")
 
-    def get_balance_single_address(self, address: str, tag: str):
+    def get_balance_single_address(
+        self, address: Union[str, AccountQuery], tag: Optional[str] = None
+    ):
         """Get the Ether balance of a given address.
 
-        address : the string representing the address to check for balance
+        address : the string representing the address to check for balance,
+        or an `AccountQuery` holding both arguments
         tag : the string pre-defined block parameter,
-        either **earliest**, **pending** or **latest**
+        either **earliest**, **pending** or **latest** (default)
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "balance",
-                "address": address,
-                "tag": tag,
-            }
-        )
-
-    def get_balance_multiple_addresses(self, address: List[str], tag: str):
+        if isinstance(address, AccountQuery):
+            if tag is not None:
+                raise TypeError("tag is given by the AccountQuery")
+            address, tag = address
+        elif tag is None:
+            tag = "latest"
+        return self._call("account", "balance", address=address, tag=tag)
+
+    def get_balance_multiple_addresses(
+        self, address: Union[str, Sequence[str]], tag: str
+    ):
         """Get the balance of the accounts from a list of addresses.
 
         address : the strings representing the addresses to check for balance,
-        separated by, up to 20 addresses per call
+        or a single string separated by commas, up to 20 addresses per call
         tag : the integer pre-defined block parameter,
         either **earliest**, **pending** or **latest**
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "balancemulti",
-                "address": address,
-                "tag": tag,
-            }
+        if not isinstance(address, str):
+            address = ",".join(address)
+        return self._call("account", "balancemulti", address=address, tag=tag)
+
+    def get_balances(
+        self, addresses: List[str], tag: str = "latest"
+    ) -> List[Dict[str, str]]:
+        """Get the balance of the accounts of any number of addresses.
+
+        addresses : the strings representing the addresses to check for
+        balance, requested by batches of 20 addresses
+        tag : the string pre-defined block parameter,
+        either **earliest**, **pending** or **latest**
+
+        Returns the `{"account": ..., "balance": ...}` entries of all the
+        batches. A failed batch raises an `EtherscanAPIError`, or with
+        `fail_silently` its entries are missing.
+        """
+        batches = chunks(addresses, self.BALANCE_MULTI_SIZE)
+        return self._merge_balances(
+            batches,
+            [
+                self.get_balance_multiple_addresses(address=chunk, tag=tag)
+                for chunk in batches
+            ],
         )
 
+    def _merge_balances(
+        self, batches: List[Sequence[str]], responses: List[Any]
+    ) -> List[Dict[str, str]]:
+        """Merge the balancemulti responses of the batches of addresses."""
+        for batch, response in zip(batches, responses):
+            # None is an HTTP error, already handled by _fail
+            if response is not None:
+                self._result_list(response, {"address": batch})
+        return merge_results(responses)
+
     def get_normal_transactions_by_address(
         self,
         address: str,
-        startblock: int,
-        endblock: int,
-        page: int,
-        offset: int,
-        sort: str,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
     ):
         """Get the list of transactions performed by an address+optional pagination.
 
@@ -124,27 +558,50 @@ class Etherscan:
         and **desc** to sort by descendin Tip: Specify a smaller startblock
         and endblock range for faster search results.
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "txlist",
-                "address": address,
-                "startblock": startblock,
-                "endblock": endblock,
-                "page": page,
-                "offsetoffset": offset,
-                "sort": sort,
-            }
+        return self._call(
+            "account",
+            "txlist",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
+        )
+
+    def iter_normal_transactions_by_address(
+        self,
+        address: str,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the transactions performed by an address.
+
+        Takes the same arguments as `get_normal_transactions_by_address`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "txlist",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
         )
 
     def get_internal_transactions_by_address(
         self,
         address: str,
-        startblock: int,
-        endblock: int,
-        page: int,
-        offset: int,
-        sort: str,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
     ):
         """Get list internal transactions performed by address+optional pagination.
 
@@ -156,17 +613,40 @@ class Etherscan:
         sort : the sorting preference, use **asc** to sort by ascending and
         **desc** to sort by descending
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "txlistinternal",
-                "address": address,
-                "startblock": startblock,
-                "endblock": endblock,
-                "page": page,
-                "offsetoffset": offset,
-                "sort": sort,
-            }
+        return self._call(
+            "account",
+            "txlistinternal",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
+        )
+
+    def iter_internal_transactions_by_address(
+        self,
+        address: str,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the internal transactions performed by an address.
+
+        Takes the same arguments as `get_internal_transactions_by_address`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "txlistinternal",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
         )
 
     def get_internal_transactions_by_hash(self, txhash: str):
@@ -175,16 +655,15 @@ class Etherscan:
         txhash : the string representing the transaction hash to check
         for internal transactions
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "txlistinternal",
-                "txhash": txhash,
-            }
-        )
+        return self._call("account", "txlistinternal", txhash=txhash)
 
     def get_internal_transactions_by_block_range(
-        self, startblock: int, endblock: int, page: int, offset: int, sort: str
+        self,
+        startblock: int,
+        endblock: int,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
     ):
         """Get list internal transactions performed in block range.
 
@@ -195,27 +674,48 @@ class Etherscan:
         sort : the sorting preference, use **asc** to sort by ascending and
         **desc** to sort by descending
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "txlistinternal",
-                "startblock": startblock,
-                "endblock": endblock,
-                "page": page,
-                "offsetoffset": offset,
-                "sort": sort,
-            }
+        return self._call(
+            "account",
+            "txlistinternal",
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
+        )
+
+    def iter_internal_transactions_by_block_range(
+        self,
+        startblock: int,
+        endblock: int,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the internal transactions performed in block range.
+
+        Takes the same arguments as `get_internal_transactions_by_block_range`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "txlistinternal",
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
         )
 
     def get_erc20_token_transferred_by_address(
         self,
         address: str,
         contractaddress: str,
-        page: int,
-        offset: int,
-        startblock: int,
-        endblock: int,
-        sort: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        sort: Optional[str] = None,
     ):
         """Get list ERC-20 tokens transferred by address+filter by token contract.
 
@@ -229,29 +729,54 @@ class Etherscan:
         sort : the sorting preference, use **asc** to sort by ascending and
         **desc** to sort by descending
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "tokentx",
-                "contractaddress": contractaddress,
-                "address": address,
-                "page": page,
-                "offset": offset,
-                "startblock": startblock,
-                "endblock": endblock,
-                "sort": sort,
-            }
+        return self._call(
+            "account",
+            "tokentx",
+            contractaddress=contractaddress,
+            address=address,
+            page=page,
+            offset=offset,
+            startblock=startblock,
+            endblock=endblock,
+            sort=sort,
+        )
+
+    def iter_erc20_token_transferred_by_address(
+        self,
+        address: str,
+        contractaddress: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the ERC-20 tokens transferred by an address.
+
+        Takes the same arguments as `get_erc20_token_transferred_by_address`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "tokentx",
+            contractaddress=contractaddress,
+            address=address,
+            page=page,
+            offset=offset,
+            startblock=startblock,
+            endblock=endblock,
+            sort=sort,
         )
 
     def get_erc721_token_transferred_by_address(
         self,
         address: str,
         contractaddress: str,
-        page: int,
-        offset: int,
-        startblock: int,
-        endblock: int,
-        sort: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        sort: Optional[str] = None,
     ):
         """Get list of ERC-721 (NFT) tokens transferred by an address.
 
@@ -265,22 +790,51 @@ class Etherscan:
         sort : the sorting preference, use **asc** to sort by ascending and
         **desc** to sort by descending
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "tokennfttx",
-                "contractaddress": contractaddress,
-                "address": address,
-                "page": page,
-                "offset": offset,
-                "startblock": startblock,
-                "endblock": endblock,
-                "sort": sort,
-            }
+        return self._call(
+            "account",
+            "tokennfttx",
+            contractaddress=contractaddress,
+            address=address,
+            page=page,
+            offset=offset,
+            startblock=startblock,
+            endblock=endblock,
+            sort=sort,
+        )
+
+    def iter_erc721_token_transferred_by_address(
+        self,
+        address: str,
+        contractaddress: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+        startblock: Optional[int] = None,
+        endblock: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the ERC-721 (NFT) tokens transferred by an address.
+
+        Takes the same arguments as `get_erc721_token_transferred_by_address`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "tokennfttx",
+            contractaddress=contractaddress,
+            address=address,
+            page=page,
+            offset=offset,
+            startblock=startblock,
+            endblock=endblock,
+            sort=sort,
         )
 
     def get_blocks_mined_by_address(
-        self, address: str, blocktype: str, page: int, offset: int
+        self,
+        address: str,
+        blocktype: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
     ):
         """Get the list of blocks mined by an address.
 
@@ -290,15 +844,34 @@ class Etherscan:
         page : the integer page number, if pagination is enabled
         offset : the number of transactions displayed per page
         """
-        return self._get(
-            params={
-                "module": "account",
-                "action": "getminedblocks",
-                "address": address,
-                "blocktype": blocktype,
-                "page": page,
-                "offset": offset,
-            }
+        return self._call(
+            "account",
+            "getminedblocks",
+            address=address,
+            blocktype=blocktype,
+            page=page,
+            offset=offset,
+        )
+
+    def iter_blocks_mined_by_address(
+        self,
+        address: str,
+        blocktype: str,
+        page: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the blocks mined by an address.
+
+        Takes the same arguments as `get_blocks_mined_by_address`,
+        the response is parsed incrementally.
+        """
+        return self._stream(
+            "account",
+            "getminedblocks",
+            address=address,
+            blocktype=blocktype,
+            page=page,
+            offset=offset,
         )
 
     def get_abi_verified_smart_contract(self, address: str):
@@ -306,26 +879,14 @@ class Etherscan:
 
         address : the contract address that has a verified source code
         """
-        return self._get(
-            params={
-                "module": "contract",
-                "action": "getabi",
-                "address": address,
-            }
-        )
+        return self._call("contract", "getabi", address=address)
 
     def get_source_code_smart_contract(self, address: str):
         """Get the Solidity source code of a verified smart contract.
 
         address : the contract address that has a verified source code
         """
-        return self._get(
-            params={
-                "module": "contract",
-                "action": "getsourcecode",
-                "address": address,
-            }
-        )
+        return self._call("contract", "getsourcecode", address=address)
 
     def get_contract_execution_status(self, txhash: str):
         """Get the status code of a contract execution.
@@ -333,13 +894,7 @@ class Etherscan:
         txhash : the string representing the transaction hash
         to check the execution status
         """
-        return self._get(
-            params={
-                "module": "transaction",
-                "action": "getstatus",
-                "txhash": txhash,
-            }
-        )
+        return self._call("transaction", "getstatus", txhash=txhash)
 
     def get_transaction_execution_status(self, txhash: str):
         """Get the status code of a transaction execution.
@@ -347,13 +902,7 @@ class Etherscan:
         txhash : the string representing the transaction hash
         to check the execution status
         """
-        return self._get(
-            params={
-                "module": "transaction",
-                "action": "gettxreceiptstatus",
-                "txhash": txhash,
-            }
-        )
+        return self._call("transaction", "gettxreceiptstatus", txhash=txhash)
 
     def get_block_uncleblock_reward_by_blockno(self, blockno: int):
         """Get the block reward and 'Uncle' block rewards.
@@ -361,13 +910,7 @@ class Etherscan:
         Args:
             blockno : the integer block number to check block rewards for eg.
         """
-        return self._get(
-            params={
-                "module": "block",
-                "action": "getblockreward",
-                "blockno": blockno,
-            }
-        )
+        return self._call("block", "getblockreward", blockno=blockno)
 
     def get_estimate_mined_countdown_by_blockno(self, blockno: int):
         """Get estimated time remaining until a certain block is mined.
@@ -376,13 +919,7 @@ class Etherscan:
             blockno : the integer block number to estimate time remaining
                 to be mined.
         """
-        return self._get(
-            params={
-                "module": "block",
-                "action": "getblockcountdown",
-                "blockno": blockno,
-            }
-        )
+        return self._call("block", "getblockcountdown", blockno=blockno)
 
     def get_block_number_by_tymestamp(self, timestamp: int):
         """Get the block number that was mined at a certain timestamp.
@@ -391,19 +928,11 @@ class Etherscan:
         closest : the closest available block to the provided timestamp,
         either before or after
         """
-        return self._get(
-            params={
-                "module": "block",
-                "action": "getblocknobytime",
-                "timestamp": timestamp,
-            }
-        )
+        return self._call("block", "getblocknobytime", timestamp=timestamp)
 
     def get_no_most_recent_block(self):
         """Get the number of most recent block."""
-        return self._get(
-            params={"module": "proxy", "action": "eth_blockNumber"}
-        )
+        return self._call("proxy", "eth_blockNumber")
 
     def get_block_by_number(self, tag: str, boolean: bool):
         """Get information about a block by block number.
@@ -413,13 +942,8 @@ class Etherscan:
         when true, returns full transaction objects and their information,
         when false only returns a list of transactions.
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getblockbynumber",
-                "tag": tag,
-                "boolean": boolean,
-            }
+        return self._call(
+            "proxy", "eth_getblockbynumber", tag=tag, boolean=boolean
         )
 
     def get_uncle_by_block_number(self, tag: str, index: str):
@@ -428,13 +952,8 @@ class Etherscan:
         tag : the block number, in hex eg. 0xC36B3C
         index : the position of the uncle's index in the block, in hex eg. 0x5
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getUncleByBlockNumberAndIndex",
-                "tag": tag,
-                "index": index,
-            }
+        return self._call(
+            "proxy", "eth_getUncleByBlockNumberAndIndex", tag=tag, index=index
         )
 
     def get_number_transaction_in_block(self, tag: str):
@@ -442,12 +961,8 @@ class Etherscan:
 
         tag : the block number, in hex eg. 0x10FB78
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getBlockTransactionCountByNumber",
-                "tag": tag,
-            }
+        return self._call(
+            "proxy", "eth_getBlockTransactionCountByNumber", tag=tag
         )
 
     def get_transaction_by_hash(self, txhash: str):
@@ -455,13 +970,7 @@ class Etherscan:
 
         txhash : the string representing the hash of the transaction
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getTransactionByHash",
-                "txhash": txhash,
-            }
-        )
+        return self._call("proxy", "eth_getTransactionByHash", txhash=txhash)
 
     def get_transaction_by_blocknumber_and_index(self, tag: str, index: str):
         """Get info about transaction by block number&transaction index position.
@@ -469,13 +978,11 @@ class Etherscan:
         tag : the block number, in hex eg. 0x10FB78
         index : the position of the uncle's index in the block, in hex eg. 0x0
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getTransactionByBlockNumberAndIndex",
-                "tag": tag,
-                "index": index,
-            }
+        return self._call(
+            "proxy",
+            "eth_getTransactionByBlockNumberAndIndex",
+            tag=tag,
+            index=index,
         )
 
     def get_count_transactions_by_address(self, address: str, tag: str):
@@ -485,13 +992,8 @@ class Etherscan:
         tag : the string pre-defined block parameter, either earliest,
         pending or latest
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getTransactionCount",
-                "address": address,
-                "tag": tag,
-            }
+        return self._call(
+            "proxy", "eth_getTransactionCount", address=address, tag=tag
         )
 
     def get_receipt_by_transaction_hash(self, txhash: str):
@@ -499,29 +1001,19 @@ class Etherscan:
 
         txhash : the string representing the hash of the transaction
         """
-        return self._get(
-            params={
-                "module": "proxy",
-                "action": "eth_getTransactionReceipt",
-                "txhash": txhash,
-            }
-        )
+        return self._call("proxy", "eth_getTransactionReceipt", txhash=txhash)
 
     def get_gas_price(self):
         """Get the current price per gas in wei."""
-        return self._get(params={"module": "proxy", "action": "eth_gasPrice"})
+        return self._call("proxy", "eth_gasPrice")
 
     def get_erc20_in_circulation(self, contractaddress: str):
         """Get the current amount of an ERC-20 token in circulation.
 
         contractaddress : the contract address of the ERC-20 token
         """
-        return self._get(
-            params={
-                "module": "stats",
-                "action": "tokensupply",
-                "contractaddress": contractaddress,
-            }
+        return self._call(
+            "stats", "tokensupply", contractaddress=contractaddress
         )
 
     def get_erc20_balance_of_address(self, contractaddress: str, address: str):
@@ -530,26 +1022,24 @@ class Etherscan:
         contractaddress : the contract address of the ERC-20 token
         address : the string representing the address to check for token balance
         """
-        return self._get(
-            params={
-                "module": "stats",
-                "action": "tokenbalance",
-                "contractaddress": contractaddress,
-                "address": address,
-            }
+        return self._call(
+            "stats",
+            "tokenbalance",
+            contractaddress=contractaddress,
+            address=address,
         )
 
     def get_ether_supply(self):
         """Get the current amount of Ether in circulation."""
-        return self._get(params={"module": "stats", "action": "ethsupply"})
+        return self._call("stats", "ethsupply")
 
     def get_eth2_supply(self):
         """Get ETH in circulation+ETH2 Staking reward+EIP1559 burnt fee stat."""
-        return self._get(params={"module": "stats", "action": "ethsupply2"})
+        return self._call("stats", "ethsupply2")
 
     def get_ether_last_price(self):
         """Get the latest price of 1 ETH."""
-        return self._get(params={"module": "stats", "action": "ethprice"})
+        return self._call("stats", "ethprice")
 
     def get_nodes_size(
         self,
@@ -568,18 +1058,16 @@ class Etherscan:
             syncmode : the  to run, either default or archive
             sort : the sorting preference, asc or desc
         """
-        return self._get(
-            params={
-                "module": "stats",
-                "action": "chainsize",
-                "startdate": startdate,
-                "enddate": enddate,
-                "clienttype": clienttype,
-                "syncmode": syncmode,
-                "sort": sort,
-            }
+        return self._call(
+            "stats",
+            "chainsize",
+            startdate=startdate,
+            enddate=enddate,
+            clienttype=clienttype,
+            syncmode=syncmode,
+            sort=sort,
         )
 
     def get_total_nodes_count(self):
         """Get the total number of discoverable Ethereum nodes."""
-        return self._get(params={"module": "stats", "action": "nodecount"})
+        return self._call("stats", "nodecount")
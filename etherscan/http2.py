@@ -0,0 +1,79 @@
+"""Asynchronous Etherscan API wrapper over HTTP/2."""
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
+import httpx
+import requests
+
+from .aio import AsyncEtherscan
+
+
+class _AsyncBody:
+    """Async file-like object reading the chunks of a streamed response."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read the next chunk, or the whole remaining body if `size` < 0."""
+        if size == 0:
+            # ijson reads 0 bytes first to check the type of the body
+            return b""
+        if size < 0:
+            return b"".join([chunk async for chunk in self._chunks])
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class HttpxEtherscan(AsyncEtherscan):
+    """Asynchronous Etherscan API wrapper using httpx over HTTP/2.
+
+    Behaves like `AsyncEtherscan`, but concurrent requests are multiplexed
+    over a single connection instead of one connection each.
+
+    async with HttpxEtherscan(key="<your-key-here>") as es:
+        await es.get_gas_oracle()
+    """
+
+    __slots__ = ()
+
+    RETRY_ERRORS = (httpx.TransportError,)
+
+    async def __aenter__(self):
+        self._session = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": self.USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            timeout=httpx.Timeout(self.TIMEOUT[1], connect=self.TIMEOUT[0]),
+        )
+        self._sem = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def close(self):
+        """Close the underlying client and release its connections."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def _request(self, url: str) -> requests.Response:
+        """Send a single request and read its response."""
+        async with self._sem:
+            r = await self._session.get(url)
+        return self._to_response(
+            r.status_code, r.headers, str(r.url), r.content
+        )
+
+    @contextlib.asynccontextmanager
+    async def _open_stream(self, url: str):
+        """Send a streamed request, yield its status, headers and body."""
+        async with self._sem:
+            async with self._session.stream("GET", url) as r:
+                yield r.status_code, r.headers, _AsyncBody(r.aiter_bytes())
@@ -0,0 +1,41 @@
+"""Client-side rate limiting."""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    rate : the number of tokens added to the bucket per second
+    capacity : the maximum number of tokens in the bucket, i.e. the allowed
+    burst, defaults to `rate`
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def consume(self, tokens: float = 1):
+        """Take tokens, blocking until they are available."""
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
@@ -1,4 +1,13 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    # orjson parses bytes directly and is much faster than the stdlib
+    from orjson import dumps, loads
+except ImportError:
+    try:
+        from ujson import dumps, loads  # type: ignore[assignment]
+    except ImportError:
+        from json import dumps, loads  # type: ignore[assignment]
 
 
 def remove_empty_dict_values(dic: Dict[str, Any]) -> Dict[str, Any]:
@@ -6,25 +15,48 @@ def remove_empty_dict_values(dic: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in dic.items() if v is not None}
 
 
-def clean_dict_values(dic: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert booleans and lists to strings in a dict."""
-    for key, value in dic.items():
+def clean_value(value: Any) -> Any:
+    """Convert a boolean or a list to a string."""
+    if isinstance(value, bool):
+        # convert a boolean to a string
+        return "true" if value else "false"
 
-        if isinstance(value, bool):
-            # convert a boolean to a string
-            dic[key] = str(value).lower()
+    if isinstance(value, list):
+        # convert a list to a string
+        return ",".join([str(i) for i in value])
 
-        elif isinstance(value, list):
-            # convert a list to a string
-            dic[key] = ",".join([str(i) for i in value])
+    return value
 
+
+def clean_dict_values(dic: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert booleans and lists to strings in a dict."""
+    for key, value in dic.items():
+        dic[key] = clean_value(value)
     return dic
 
 
 def clean_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Clean requests params removing empty values."""
+    """Clean requests params removing empty values.
+
+    Done in a single pass, the given dict is left untouched.
+    """
     if not params:
         return None
-    params = remove_empty_dict_values(params)
-    params = clean_dict_values(params)
-    return params
+    return {k: clean_value(v) for k, v in params.items() if v is not None}
+
+
+def chunks(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    """Split a sequence in consecutive chunks of at most `size` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def merge_results(responses: List[Any]) -> List[Any]:
+    """Concatenate the result lists of several API responses.
+
+    Failed responses (None or with an error message as result) are skipped.
+    """
+    results = []
+    for response in responses:
+        if response and isinstance(response.get("result"), list):
+            results.extend(response["result"])
+    return results
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 from setuptools import setup
@@ -6,9 +7,27 @@ ROOT = pathlib.Path(__file__).parent
 
 README = (ROOT / "README.md").read_text()
 
+ABOUT = {}
+exec((ROOT / "etherscan" / "__version__.py").read_text(), ABOUT)
+
+EXT_MODULES = []
+if os.environ.get("ETHERSCAN_COMPILE") == "1":
+    # Compile the per-request helpers with mypyc, the client classes stay
+    # interpreted so they can be subclassed and patched in tests
+    from mypyc.build import mypycify
+
+    EXT_MODULES = mypycify(
+        [
+            "--follow-imports=silent",
+            "etherscan/cache.py",
+            "etherscan/ratelimit.py",
+            "etherscan/utils.py",
+        ]
+    )
+
 setup(
     name="py-etherscan-client",
-    version="1.0.0",
+    version=ABOUT["__version__"],
     description="Etherscan API wrapper",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -22,5 +41,13 @@ setup(
     ],
     packages=["etherscan"],
     include_package_data=True,
-    install_requires=["requests"],
+    ext_modules=EXT_MODULES,
+    install_requires=["requests", "urllib3>=1.26"],
+    extras_require={
+        "async": ["aiohttp"],
+        "orjson": ["orjson"],
+        "stream": ["ijson"],
+        "brotli": ["brotli"],
+        "http2": ["aiohttp", "httpx[http2]"],
+    },
 )
@@ -0,0 +1,331 @@
+import asyncio
+import inspect
+from unittest import IsolatedAsyncioTestCase, mock
+
+import aiohttp
+
+from etherscan.aio import AsyncEtherscan
+from etherscan.etherscan import Etherscan, EtherscanAPIError
+
+
+def mock_response(status=200, content=b"{}", headers=None):
+    response = mock.MagicMock(status=status, headers=headers or {}, url="test")
+    response.read = mock.AsyncMock(return_value=content)
+    response.__aenter__.return_value = response
+    return response
+
+
+def mock_stream_response(status=200, content=b"{}", headers=None):
+    response = mock_response(status=status, headers=headers)
+    response.content = asyncio.StreamReader()
+    response.content.feed_data(content)
+    response.content.feed_eof()
+    return response
+
+
+class AsyncEtherscanTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = AsyncEtherscan(key="123test", plan="free")
+        await self.api.__aenter__()
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    def mock_session_get(self, *responses):
+        session_get = mock.MagicMock(side_effect=responses)
+        return mock.patch.object(self.api._session, "get", session_get)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.api, "__dict__"))
+
+    def test_key_read_only(self):
+        self.assertEqual(self.api.key, "123test")
+        with self.assertRaises(AttributeError):
+            self.api.key = "456test"
+
+    def test_sync_context_manager(self):
+        with self.assertRaisesRegex(TypeError, "async with"):
+            with AsyncEtherscan(key="123test"):
+                pass
+
+    async def test_get(self):
+        with self.mock_session_get(mock_response()) as mock_get:
+            self.assertEqual(await self.api._get(), {})
+        mock_get.assert_called_once_with(
+            "https://api.etherscan.io/api?apikey=123test"
+        )
+
+    async def test_get_params(self):
+        with self.mock_session_get(mock_response()) as mock_get:
+            await self.api._get(params={"module": "stats", "tag": None})
+        mock_get.assert_called_once_with(
+            "https://api.etherscan.io/api?apikey=123test&module=stats"
+        )
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_404_status(self, mock_log):
+        response = mock_response(status=404, content=b"404 Not Found Message")
+        with self.mock_session_get(response):
+            with self.assertRaises(EtherscanAPIError) as context:
+                await self.api._get()
+        self.assertEqual("404 404 Not Found Message", str(context.exception))
+        mock_log.assert_called_once()
+
+    @mock.patch("etherscan.etherscan.logger.info")
+    async def test_get_404_status_fail_silently(self, mock_log):
+        self.api.fail_silently = True
+        response = mock_response(status=404, content=b"404 Not Found Message")
+        with self.mock_session_get(response):
+            self.assertEqual(await self.api._get(), None)
+        mock_log.assert_called_once()
+
+    @mock.patch("asyncio.sleep")
+    async def test_get_retry(self, mock_sleep):
+        responses = (
+            mock_response(status=503),
+            mock_response(status=429, headers={"Retry-After": "2"}),
+            mock_response(content=b'{"status": "1"}'),
+        )
+        with self.mock_session_get(*responses) as mock_get:
+            self.assertEqual(await self.api._get(), {"status": "1"})
+        self.assertEqual(mock_get.call_count, 3)
+        mock_sleep.assert_any_await(2.0)
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    @mock.patch("asyncio.sleep")
+    async def test_get_retry_exhausted(self, mock_sleep, mock_log):
+        self.api.max_retries = 1
+        responses = (mock_response(status=502), mock_response(status=502))
+        with self.mock_session_get(*responses) as mock_get:
+            with self.assertRaises(EtherscanAPIError):
+                await self.api._get()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch("asyncio.sleep")
+    async def test_get_retry_connection_error(self, mock_sleep):
+        self.api.max_retries = 1
+        errors = (aiohttp.ClientConnectionError(),) * 2
+        with self.mock_session_get(*errors) as mock_get:
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                await self.api._get()
+        self.assertEqual(mock_get.call_count, 2)
+
+    async def test_get_stream(self):
+        content = b'{"status": "1", "result": [{"a": 1}, {"b": 2.5}]}'
+        response = mock_stream_response(content=content)
+        with self.mock_session_get(response) as mock_get:
+            items = self.api.iter_normal_transactions_by_address(address="a")
+            mock_get.assert_not_called()
+            self.assertEqual(await items.__anext__(), {"a": 1})
+            self.assertEqual([item async for item in items], [{"b": 2.5}])
+        mock_get.assert_called_once_with(
+            "https://api.etherscan.io/api?apikey=123test"
+            "&address=a&module=account&action=txlist"
+        )
+
+    @mock.patch("etherscan.etherscan.ijson.items")
+    async def test_get_stream_small_response(self, mock_items):
+        content = b'{"status": "1", "result": [{"a": 1}]}'
+        headers = {"Content-Length": str(len(content))}
+        response = mock_stream_response(content=content, headers=headers)
+        with self.mock_session_get(response):
+            self.assertEqual(
+                [item async for item in self.api._get_stream()], [{"a": 1}]
+            )
+        mock_items.assert_not_called()
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_stream_error_message(self, mock_log):
+        content = b'{"status": "0", "result": "Max rate limit reached"}'
+        for headers in ({"Content-Length": str(len(content))}, None):
+            response = mock_stream_response(content=content, headers=headers)
+            with self.mock_session_get(response):
+                with self.assertRaises(EtherscanAPIError) as context:
+                    [item async for item in self.api._get_stream()]
+            self.assertEqual(str(context.exception), "Max rate limit reached")
+        self.assertEqual(mock_log.call_count, 2)
+
+    @mock.patch("etherscan.etherscan.logger.info")
+    async def test_get_stream_error_message_fail_silently(self, mock_log):
+        self.api.fail_silently = True
+        content = b'{"status": "0", "result": "Invalid API Key"}'
+        with self.mock_session_get(mock_stream_response(content=content)):
+            self.assertEqual(
+                [item async for item in self.api._get_stream()], []
+            )
+        mock_log.assert_called_once()
+
+    async def test_get_stream_no_transactions(self):
+        content = b'{"status": "0", "result": []}'
+        with self.mock_session_get(mock_stream_response(content=content)):
+            self.assertEqual(
+                [item async for item in self.api._get_stream()], []
+            )
+
+    @mock.patch("asyncio.sleep")
+    async def test_get_stream_retry(self, mock_sleep):
+        responses = (
+            mock_stream_response(status=503),
+            mock_stream_response(content=b'{"result": [1]}'),
+        )
+        with self.mock_session_get(*responses) as mock_get:
+            self.assertEqual(
+                [item async for item in self.api._get_stream()], [1]
+            )
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch("asyncio.sleep")
+    async def test_get_stream_retry_connection_error(self, mock_sleep):
+        self.api.max_retries = 1
+        errors = (aiohttp.ClientConnectionError(),) * 2
+        with self.mock_session_get(*errors) as mock_get:
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                [item async for item in self.api._get_stream()]
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_stream_404_status(self, mock_log):
+        response = mock_stream_response(status=404, content=b"Not Found")
+        with self.mock_session_get(response):
+            with self.assertRaises(EtherscanAPIError) as context:
+                [item async for item in self.api._get_stream()]
+        self.assertEqual("404 Not Found", str(context.exception))
+
+    async def test_get_stream_without_session(self):
+        await self.api.close()
+        with self.assertRaises(RuntimeError):
+            await self.api._get_stream().__anext__()
+
+    def test_retry_delay(self):
+        self.assertEqual(self.api._retry_delay(0, "3"), 3)
+        for attempt in range(10):
+            delay = self.api._retry_delay(attempt, "Wed, 21 Oct 2015")
+            self.assertLessEqual(delay, self.api.RETRY_BACKOFF_MAX)
+
+    async def test_get_without_session(self):
+        await self.api.close()
+        with self.assertRaises(RuntimeError):
+            await self.api._get()
+
+    @mock.patch(
+        "etherscan.aio.AsyncEtherscan._get", new_callable=mock.AsyncMock
+    )
+    async def test_get_gas_oracle(self, mock_get):
+        mock_get.return_value = {"status": "1"}
+        self.assertEqual(await self.api.get_gas_oracle(), {"status": "1"})
+        mock_get.assert_awaited_once_with(
+            params={"module": "gastracker", "action": "gasoracle"}
+        )
+
+    @mock.patch(
+        "etherscan.aio.AsyncEtherscan._get", new_callable=mock.AsyncMock
+    )
+    async def test_get_balances(self, mock_get):
+        addresses = [f"test{i}" for i in range(25)]
+        mock_get.side_effect = lambda params: {
+            "status": "1",
+            "result": [{"account": a} for a in params["address"].split(",")],
+        }
+        balances = await self.api.get_balances(addresses=addresses)
+        self.assertEqual(mock_get.await_count, 2)
+        self.assertEqual([b["account"] for b in balances], addresses)
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    @mock.patch(
+        "etherscan.aio.AsyncEtherscan._get", new_callable=mock.AsyncMock
+    )
+    async def test_get_balances_error(self, mock_get, mock_log):
+        mock_get.return_value = {"status": "0", "result": "Error!"}
+        with self.assertRaises(EtherscanAPIError):
+            await self.api.get_balances(addresses=["bad"] * 25)
+
+    @mock.patch(
+        "etherscan.aio.AsyncEtherscan._get", new_callable=mock.AsyncMock
+    )
+    async def test_batch_get(self, mock_get):
+        mock_get.side_effect = lambda params: params["txhash"]
+        calls = [{"txhash": f"0x{i}"} for i in range(3)]
+        self.assertEqual(await self.api.batch_get(calls), ["0x0", "0x1", "0x2"])
+        self.assertEqual(mock_get.await_count, 3)
+
+    @mock.patch(
+        "etherscan.aio.AsyncEtherscan._get", new_callable=mock.AsyncMock
+    )
+    async def test_gather(self, mock_get):
+        mock_get.side_effect = lambda params: params["action"]
+        calls = [("get_gas_price", {}), ("get_ether_last_price", {})]
+        self.assertEqual(
+            await self.api.gather(calls), ["eth_gasPrice", "ethprice"]
+        )
+        self.assertEqual(mock_get.await_count, 2)
+
+    @mock.patch("etherscan.etherscan.Etherscan._get")
+    async def test_gather_invalid_name(self, mock_get):
+        for name in ("iter_normal_transactions_by_address", "_get", "gather"):
+            with self.assertRaisesRegex(ValueError, name):
+                await self.api.gather([("get_gas_price", {}), (name, {})])
+        mock_get.assert_not_called()
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    @mock.patch("etherscan.etherscan.Etherscan._get")
+    async def test_methods_mirror_sync(self, mock_get, mock_get_stream):
+        # the lifecycle methods are the only ones not mirrored
+        excluded = {"close"}
+        arguments = {
+            "batch_get": {"calls": [{"module": "stats", "action": "ethprice"}]},
+            "gather": {
+                "calls": [("get_gas_price", {}), ("get_ether_supply", {})]
+            },
+            "get_balances": {"addresses": [f"test{i}" for i in range(25)]},
+        }
+        self.assertTrue(inspect.isasyncgenfunction(AsyncEtherscan._get_stream))
+
+        async def empty_stream(params):
+            return
+            yield
+
+        mock_async_get = mock.AsyncMock()
+        mock_async_get_stream = mock.MagicMock(side_effect=empty_stream)
+        mock_get_stream.side_effect = lambda params: iter(())
+        for mock_ in (mock_get, mock_async_get):
+            mock_.return_value = {"status": "1", "result": []}
+
+        sync_api = Etherscan(key="123test")
+        names = [
+            name
+            for name, _ in inspect.getmembers(Etherscan, inspect.isfunction)
+            if not name.startswith("_") and name not in excluded
+        ]
+        with mock.patch.object(
+            AsyncEtherscan, "_get", mock_async_get
+        ), mock.patch.object(
+            AsyncEtherscan, "_get_stream", mock_async_get_stream
+        ):
+            for name in names:
+                parameters = inspect.signature(
+                    getattr(Etherscan, name)
+                ).parameters
+                kwargs = arguments.get(name) or {
+                    arg: "test" for arg in parameters if arg != "self"
+                }
+                for mock_ in (mock_get, mock_get_stream, mock_async_get):
+                    mock_.reset_mock()
+                mock_async_get_stream.reset_mock()
+
+                result = getattr(sync_api, name)(**kwargs)
+                async_result = getattr(self.api, name)(**kwargs)
+                if name.startswith("iter_"):
+                    list(result)
+                    self.assertEqual([item async for item in async_result], [])
+                else:
+                    self.assertEqual(await async_result, result)
+
+                # batch_get and gather send from threads in any order
+                self.assertCountEqual(
+                    mock_async_get.await_args_list, mock_get.call_args_list
+                )
+                self.assertEqual(
+                    mock_async_get_stream.call_args_list,
+                    mock_get_stream.call_args_list,
+                )
+                self.assertTrue(mock_get.called or mock_get_stream.called, name)
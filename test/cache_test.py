@@ -0,0 +1,107 @@
+import math
+from unittest import mock
+
+import pytest
+
+from etherscan.cache import RedisCache, TTLCache
+
+
+def test_get_set():
+    cache = TTLCache()
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 2) == 2
+
+
+def test_get_copy():
+    cache = TTLCache()
+    value = {"result": [{"hash": "0x1"}]}
+    cache.set("a", value)
+    value["result"].clear()
+    cached = cache.get("a")
+    assert cached == {"result": [{"hash": "0x1"}]}
+    cached["result"].clear()
+    assert cache.get("a") == {"result": [{"hash": "0x1"}]}
+
+
+@mock.patch("time.monotonic", return_value=0)
+def test_ttl(mock_time):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+    cache.set("c", 3, ttl=math.inf)
+    mock_time.return_value = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    mock_time.return_value = 1e12
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 1
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_redis_get_set():
+    client = mock.Mock()
+    cache = RedisCache(client, ttl=10)
+    key = (("action", "balance"), ("address", "0x1"))
+    cache.set(key, {"result": "1"})
+    client.set.assert_called_once_with(
+        "etherscan:action=balance&address=0x1", mock.ANY, px=10000
+    )
+    client.get.return_value = client.set.call_args.args[1]
+    assert cache.get(key) == {"result": "1"}
+    client.get.assert_called_once_with("etherscan:action=balance&address=0x1")
+
+
+@pytest.mark.parametrize("module", ["ujson", "json"])
+def test_redis_str_dumps(module):
+    # ujson and json dump to str, which redis stores and returns as bytes
+    module = pytest.importorskip(module)
+    client = mock.Mock()
+    cache = RedisCache(client)
+    with mock.patch.multiple(
+        "etherscan.cache", dumps=module.dumps, loads=module.loads
+    ):
+        cache.set((), {"result": [{"hash": "0x1"}]})
+        value = client.set.call_args.args[1]
+        assert isinstance(value, str)
+        client.get.return_value = value.encode()
+        assert cache.get(()) == {"result": [{"hash": "0x1"}]}
+
+
+def test_redis_ttl():
+    client = mock.Mock()
+    cache = RedisCache(client)
+    cache.set((), 1, ttl=math.inf)
+    assert client.set.call_args.kwargs["px"] is None
+    cache.set((), 1, ttl=0.0001)
+    assert client.set.call_args.kwargs["px"] == 1
+
+
+def test_redis_miss():
+    client = mock.Mock()
+    client.get.return_value = None
+    assert RedisCache(client).get((), "default") == "default"
+
+
+def test_slots():
+    assert not hasattr(TTLCache(), "__dict__")
+    assert not hasattr(RedisCache(mock.Mock()), "__dict__")
@@ -1,91 +1,484 @@
+import io
 from unittest import TestCase, mock
 
-from etherscan.etherscan import Etherscan
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+from etherscan.etherscan import AccountQuery, Etherscan, EtherscanAPIError
+
+
+class EtherscanAPIErrorTestCase(TestCase):
+    def test_str(self):
+        response = mock.Mock(status_code=502, content=b"x" * 2000)
+        error = EtherscanAPIError(response=response)
+        self.assertEqual(error.status_code, 502)
+        self.assertEqual(str(error), "502 " + "x" * error.PREVIEW_SIZE)
+
+    def test_str_without_response(self):
+        error = EtherscanAPIError(message="Error! Invalid address format")
+        self.assertIsNone(error.status_code)
+        self.assertEqual(str(error), "Error! Invalid address format")
+
+    def test_str_invalid_utf8(self):
+        response = mock.Mock(status_code=500, content=b"\xff error")
+        self.assertEqual(
+            str(EtherscanAPIError(response=response)), "500 \ufffd error"
+        )
 
 
 class EtherscanTestCase(TestCase):
     def setUp(self):
-        self.api = Etherscan(key="123test", plan="free")
+        self.session = requests.Session()
+        self.mock_send = mock.Mock(spec=self.session.send)
+        self.session.send = self.mock_send
+        self.api = Etherscan(key="123test", plan="free", session=self.session)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.api.test = "test"
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    def test_unknown_plan(self, mock_log):
+        api = Etherscan(key="123test", plan="lite", session=self.session)
+        self.assertEqual(api.plan, "lite")
+        self.assertEqual(api._bucket.rate, 5)
+        mock_log.assert_called_once()
+
+    def test_rate_limit(self):
+        api = Etherscan(key="123test", plan="lite", rate_limit=2)
+        self.assertEqual(api._bucket.rate, 2)
+
+    def test_key_read_only(self):
+        self.assertEqual(self.api.key, "123test")
+        with self.assertRaises(AttributeError):
+            self.api.key = "456test"
+
+    def test_rate_limit_not_positive(self):
+        for rate_limit in (0, -1):
+            with self.assertRaises(ValueError):
+                Etherscan(key="123test", rate_limit=rate_limit)
+
+    @mock.patch("etherscan.ratelimit.TokenBucket.consume")
+    def test_get_rate_limit(self, mock_consume):
+        self.mock_send.return_value = mock.Mock(status_code=200, content=b"{}")
+        api = Etherscan(key="123test", plan="Standard", session=self.session)
+        self.assertEqual(api._bucket.rate, 10)
+        api._get()
+        mock_consume.assert_called_once_with()
+
+    def test_session_retries(self):
+        api = Etherscan(key="123test")
+        retries = api._session.get_adapter(api.BASE_URL).max_retries
+        self.assertEqual(retries.total, 5)
+        self.assertEqual(retries.status_forcelist, self.api.RETRY_STATUSES)
+        self.assertFalse(retries.raise_on_status)
+
+    def test_session_headers(self):
+        headers = Etherscan(key="123test")._session.headers
+        self.assertEqual(headers["User-Agent"], "py-etherscan-client/1.0.0")
+        self.assertEqual(headers["Accept-Encoding"], ACCEPT_ENCODING)
+
+    def test_session(self):
+        self.session.headers["User-Agent"] = "test"
+        api = Etherscan(key="123test", session=self.session)
+        self.assertIs(api._session, self.session)
+        request = api._prepare(None)
+        self.assertEqual(
+            request.url, "https://api.etherscan.io/api?apikey=123test"
+        )
+        self.assertEqual(request.headers["User-Agent"], "test")
+        self.assertEqual(request.headers["Accept-Encoding"], ACCEPT_ENCODING)
+        self.assertEqual(self.session.params, {})
+        self.assertNotEqual(
+            self.session.headers["Accept-Encoding"], ACCEPT_ENCODING
+        )
+
+    @mock.patch("requests.Session.close")
+    def test_context_manager(self, mock_close):
+        with Etherscan(key="123test") as api:
+            self.assertIsInstance(api, Etherscan)
+        mock_close.assert_called_once()
+
+    def test_context_manager_given_session(self):
+        with mock.patch.object(self.session, "close") as mock_close:
+            with self.api:
+                pass
+        mock_close.assert_not_called()
+
+    def test_get(self):
+        self.mock_send.return_value = mock.Mock(status_code=200, content=b"{}")
+        self.assertEqual(self.api._get(), {})
+        self.mock_send.assert_called_once()
+        request = self.mock_send.call_args.args[0]
+        self.assertEqual(
+            request.url, "https://api.etherscan.io/api?apikey=123test"
+        )
+        self.assertEqual(
+            self.mock_send.call_args.kwargs["timeout"], self.api.TIMEOUT
+        )
+        # environment settings are merged when the client is created
+        self.assertTrue(self.mock_send.call_args.kwargs["verify"])
+
+    def test_prepare(self):
+        request = self.api._prepare({"module": "stats", "tag": "a b"})
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(
+            request.url,
+            "https://api.etherscan.io/api?apikey=123test&module=stats&tag=a+b",
+        )
+        self.assertIsNot(self.api._prepare(None), self.api._template)
+
+    def test_get_cache(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200, content=b'{"status": "1"}'
+        )
+        api = Etherscan(key="123test", cache=True, session=self.session)
+        params = {"module": "stats", "action": "ethprice"}
+        self.assertEqual(api._get(params=dict(params)), {"status": "1"})
+        self.assertEqual(api._get(params=dict(params)), {"status": "1"})
+        self.mock_send.assert_called_once()
+        api._get(params={"module": "stats", "action": "ethsupply"})
+        self.assertEqual(self.mock_send.call_count, 2)
+
+    def test_get_balance_cache_hit(self):
+        backend = mock.Mock()
+        backend.get.return_value = {"status": "1", "result": "1"}
+        api = Etherscan(key="123test", cache=backend, session=self.session)
+        result = api.get_balance_single_address(address="test", tag="latest")
+        self.assertEqual(result, {"status": "1", "result": "1"})
+        self.mock_send.assert_not_called()
+        backend.get.assert_called_once_with(
+            (
+                ("action", "balance"),
+                ("address", "test"),
+                ("module", "account"),
+                ("tag", "latest"),
+            )
+        )
+
+    def test_get_ether_last_price_ttl(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200, content=b'{"status": "1"}'
+        )
+        backend = mock.Mock()
+        backend.get.return_value = None
+        api = Etherscan(key="123test", cache=backend, session=self.session)
+        api.get_ether_last_price()
+        backend.set.assert_called_once_with(
+            (("action", "ethprice"), ("module", "stats")),
+            {"status": "1"},
+            ttl=30,
+        )
+
+    def test_get_latest_tag_ttl(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200, content=b'{"status": "1"}'
+        )
+        backend = mock.Mock()
+        backend.get.return_value = None
+        api = Etherscan(key="123test", cache=backend, session=self.session)
+        api.get_balance_single_address(address="test", tag="latest")
+        self.assertEqual(backend.set.call_args.kwargs["ttl"], 5)
+        api.get_balance_single_address(address="test", tag="0x10d4f")
+        self.assertIsNone(backend.set.call_args.kwargs["ttl"])
+
+    def test_get_cache_skips_errors(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200, content=b'{"status": "0"}'
+        )
+        api = Etherscan(key="123test", cache=True, session=self.session)
+        api._get(params={"module": "stats", "action": "ethprice"})
+        api._get(params={"module": "stats", "action": "ethprice"})
+        self.assertEqual(self.mock_send.call_count, 2)
+
+    def test_get_cache_skips_rpc_errors(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200,
+            content=b'{"jsonrpc": "2.0", "id": 1, "error": {"code": -32602}}',
+        )
+        api = Etherscan(key="123test", cache=True, session=self.session)
+        params = {"module": "proxy", "action": "eth_getBlockByNumber"}
+        api._get(params=dict(params))
+        api._get(params=dict(params))
+        self.assertEqual(self.mock_send.call_count, 2)
+
+    def test_get_cache_skips_live_actions(self):
+        self.mock_send.return_value = mock.Mock(
+            status_code=200, content=b'{"status": "1"}'
+        )
+        backend = mock.Mock()
+        backend.get.return_value = None
+        api = Etherscan(key="123test", cache=backend, session=self.session)
+        api.get_estimate_mined_countdown_by_blockno(blockno=1)
+        api.get_transaction_execution_status(txhash="0x1")
+        api.get_contract_execution_status(txhash="0x1")
+        api.get_receipt_by_transaction_hash(txhash="0x1")
+        backend.set.assert_not_called()
+
+    def test_get_no_cache(self):
+        self.mock_send.return_value = mock.Mock(status_code=200, content=b"{}")
+        self.api._get(params={"module": "stats", "action": "ethprice"})
+        self.api._get(params={"module": "stats", "action": "ethprice"})
+        self.assertEqual(self.mock_send.call_count, 2)
 
-    @mock.patch(
-        "requests.get", return_value=mock.Mock(status_code=200, json=lambda: {})
-    )
-    def test_get(self, mock_get):
-        self.api._get()
-        mock_get.assert_called_once_with(
-            url="https://api.etherscan.io/api",
-            params={"apikey": self.api.key},
+    def mock_stream_response(self, status_code=200, content=b"", size=None):
+        response = mock.MagicMock(
+            status_code=status_code,
+            content=content,
+            headers={} if size is None else {"Content-Length": str(size)},
+            raw=io.BytesIO(content),
         )
+        response.__enter__.return_value = response
+        return response
+
+    def test_get_stream(self):
+        content = b'{"status": "1", "result": [{"a": 1}, {"b": 2.5}]}'
+        self.mock_send.return_value = self.mock_stream_response(content=content)
+        items = self.api._get_stream(params={"module": "account"})
+        self.mock_send.assert_not_called()
+        self.assertEqual(next(items), {"a": 1})
+        self.assertEqual(list(items), [{"b": 2.5}])
+        self.assertTrue(self.mock_send.call_args.kwargs["stream"])
+
+    @mock.patch("etherscan.etherscan.ijson.items")
+    def test_get_stream_small_response(self, mock_items):
+        content = b'{"status": "1", "result": [{"a": 1}]}'
+        self.mock_send.return_value = self.mock_stream_response(
+            content=content, size=len(content)
+        )
+        self.assertEqual(list(self.api._get_stream()), [{"a": 1}])
+        mock_items.assert_not_called()
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    def test_get_stream_error_message(self, mock_log):
+        content = b'{"status": "0", "result": "Error! Invalid address format"}'
+        for size in (len(content), None):
+            self.mock_send.return_value = self.mock_stream_response(
+                content=content, size=size
+            )
+            with self.assertRaises(EtherscanAPIError) as context:
+                list(self.api._get_stream())
+            self.assertEqual(
+                str(context.exception), "Error! Invalid address format"
+            )
+        self.assertEqual(mock_log.call_count, 2)
+
+    @mock.patch("etherscan.etherscan.logger.info")
+    def test_get_stream_error_message_fail_silently(self, mock_log):
+        self.api.fail_silently = True
+        content = b'{"status": "0", "result": "Invalid API Key"}'
+        self.mock_send.return_value = self.mock_stream_response(content=content)
+        self.assertEqual(list(self.api._get_stream()), [])
+        mock_log.assert_called_once()
+
+    def test_get_stream_no_transactions(self):
+        content = (
+            b'{"status": "0", "message": "No transactions found", "result": []}'
+        )
+        self.mock_send.return_value = self.mock_stream_response(content=content)
+        self.assertEqual(list(self.api._get_stream()), [])
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    def test_get_stream_404_status(self, mock_log):
+        self.mock_send.return_value = self.mock_stream_response(
+            status_code=404, content=b"404 Not Found Message"
+        )
+        with self.assertRaises(EtherscanAPIError):
+            list(self.api._get_stream())
+        mock_log.assert_called_once()
 
+    @mock.patch("etherscan.etherscan.loads")
     @mock.patch("etherscan.etherscan.logger.warning")
-    @mock.patch(
-        "requests.get",
-        return_value=mock.Mock(
+    def test_get_404_status(self, mock_log, mock_loads):
+        self.mock_send.return_value = mock.Mock(
             status_code=404,
-            json=lambda: {"message": "Not Found"},
+            headers={"Content-Type": "application/json"},
             content=b"404 Not Found Message",
-        ),
-    )
-    def test_get_404_status(self, mock_get, mock_log):
+        )
         with self.assertRaises(Exception) as context:
             self.api._get()
         self.assertEqual(
             "404 404 Not Found Message",
             str(context.exception),
         )
-        mock_log.assert_called_once()
+        mock_log.assert_called_once_with(
+            "Etherscan API error with %s: %s", None, context.exception
+        )
+        mock_loads.assert_not_called()
 
     @mock.patch("etherscan.etherscan.logger.info")
-    @mock.patch(
-        "requests.get",
-        return_value=mock.Mock(
+    def test_get_404_status_fail_silently(self, mock_log):
+        self.mock_send.return_value = mock.Mock(
             status_code=404,
-            json=mock.Mock(side_effect=Exception("")),
             content=b"404 Not Found Message",
-        ),
-    )
-    def test_get_404_status_fail_silently(self, mock_get, mock_log):
+        )
         self.api.fail_silently = True
         self.assertEqual(self.api._get(), None)
         mock_log.assert_called_once()
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_gas_oracle(self, mock_get):
+    def test_get_normal_transactions_by_address_default_pagination(self):
+        self.mock_send.return_value = mock.Mock(status_code=200, content=b"{}")
+        self.api.get_normal_transactions_by_address(address="test")
+        self.assertEqual(
+            self.mock_send.call_args.args[0].url,
+            "https://api.etherscan.io/api?apikey=123test"
+            "&address=test&module=account&action=txlist",
+        )
+
+    def test_get_block_by_number_boolean_encoding(self):
+        self.mock_send.return_value = mock.Mock(status_code=200, content=b"{}")
+        self.api.get_block_by_number(tag="0x10d4f", boolean=True)
+        self.api.get_block_by_number(tag="0x10d4f", boolean=False)
+        urls = [c.args[0].url for c in self.mock_send.call_args_list]
+        self.assertIn("boolean=true", urls[0])
+        self.assertIn("boolean=false", urls[1])
+
+
+class EtherscanMethodsTestCase(TestCase):
+    def setUp(self):
+        self.api = Etherscan(key="123test", plan="free")
+        patcher = mock.patch.object(Etherscan, "_get", autospec=True)
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batch_get(self):
+        self.mock_get.side_effect = lambda _, params: params["txhash"]
+        calls = [
+            {
+                "module": "proxy",
+                "action": "eth_getTransactionByHash",
+                "txhash": f"0x{i}",
+            }
+            for i in range(10)
+        ]
+        results = self.api.batch_get(calls)
+        self.assertEqual(results, [f"0x{i}" for i in range(10)])
+        self.assertEqual(self.mock_get.call_count, 10)
+        self.mock_get.assert_any_call(self.api, calls[3])
+
+    def test_gather(self):
+        self.mock_get.side_effect = lambda _, params: params["action"]
+        calls = [
+            ("get_gas_price", {}),
+            ("get_ether_last_price", {}),
+            ("get_erc20_in_circulation", {"contractaddress": "test"}),
+        ]
+        results = self.api.gather(calls)
+        self.assertEqual(results, ["eth_gasPrice", "ethprice", "tokensupply"])
+        self.assertEqual(self.mock_get.call_count, 3)
+
+    def test_gather_invalid_name(self):
+        for name in ("iter_normal_transactions_by_address", "close", "get_x"):
+            with self.assertRaisesRegex(ValueError, name):
+                self.api.gather([("get_gas_price", {}), (name, {})])
+        self.mock_get.assert_not_called()
+
+    def test_get_gas_oracle(self):
         self.api.get_gas_oracle()
-        mock_get.assert_called_once_with(
-            params={"module": "gastracker", "action": "gasoracle"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "gastracker", "action": "gasoracle"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_balance_single_address(self, mock_get):
+    def test_get_balance_single_address(self):
         address = "0xde0b295669a9fd93d5f28d9ec85e40f4cb697bae"
         tag = "latest"
         self.api.get_balance_single_address(address=address, tag=tag)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "balance",
                 "address": address,
                 "tag": tag,
-            }
+            },
+        )
+
+    def test_get_balance_single_address_query(self):
+        query = AccountQuery(address="test")
+        self.api.get_balance_single_address(query)
+        self.api.get_balance_single_address("test")
+        expected = mock.call(
+            self.api,
+            params={
+                "module": "account",
+                "action": "balance",
+                "address": "test",
+                "tag": "latest",
+            },
         )
+        self.assertEqual(self.mock_get.call_args_list, [expected] * 2)
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_balance_multiple_addresses(self, mock_get):
+    def test_get_balance_single_address_query_and_tag(self):
+        with self.assertRaises(TypeError):
+            self.api.get_balance_single_address(
+                AccountQuery(address="test"), tag="pending"
+            )
+        self.mock_get.assert_not_called()
+
+    def test_get_balance_multiple_addresses(self):
         address = ["test1", "test2"]
         tag = "test"
         self.api.get_balance_multiple_addresses(address=address, tag=tag)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "balancemulti",
-                "address": address,
+                "address": "test1,test2",
                 "tag": tag,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_normal_transactions_by_address(self, mock_get):
+    def test_get_balance_multiple_addresses_string(self):
+        self.api.get_balance_multiple_addresses(
+            address="test1,test2", tag="test"
+        )
+        self.assertEqual(
+            self.mock_get.call_args.kwargs["params"]["address"], "test1,test2"
+        )
+
+    def test_get_balances(self):
+        addresses = [f"test{i}" for i in range(45)]
+        self.mock_get.side_effect = lambda _, params: {
+            "status": "1",
+            "result": [{"account": a} for a in params["address"].split(",")],
+        }
+        balances = self.api.get_balances(addresses=addresses)
+        self.assertEqual(self.mock_get.call_count, 3)
+        self.assertEqual([b["account"] for b in balances], addresses)
+        self.mock_get.assert_called_with(
+            self.api,
+            params={
+                "module": "account",
+                "action": "balancemulti",
+                "address": ",".join(addresses[40:]),
+                "tag": "latest",
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    def test_get_balances_error(self, mock_log):
+        self.mock_get.side_effect = lambda _, params: {
+            "status": "0",
+            "result": "Error! Invalid address format",
+        }
+        with self.assertRaises(EtherscanAPIError) as context:
+            self.api.get_balances(addresses=["bad"] * 25)
+        self.assertIn("Invalid address format", str(context.exception))
+        mock_log.assert_called_once()
+
+    @mock.patch("etherscan.etherscan.logger.info")
+    def test_get_balances_error_fail_silently(self, mock_log):
+        self.api.fail_silently = True
+        self.mock_get.side_effect = [
+            {"status": "0", "result": "Error! Invalid address format"},
+            {"status": "1", "result": [{"account": "test"}]},
+        ]
+        balances = self.api.get_balances(addresses=["bad"] * 20 + ["test"])
+        self.assertEqual(balances, [{"account": "test"}])
+        mock_log.assert_called_once()
+
+    def test_get_normal_transactions_by_address(self):
         address = "test"
         startblock = 1
         endblock = 2
@@ -100,7 +493,8 @@ class EtherscanTestCase(TestCase):
             offset=offset,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "txlist",
@@ -108,13 +502,35 @@ class EtherscanTestCase(TestCase):
                 "startblock": startblock,
                 "endblock": endblock,
                 "page": page,
-                "offsetoffset": offset,
+                "offset": offset,
                 "sort": sort,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_normal_transactions_by_address(self, mock_get_stream):
+        self.api.iter_normal_transactions_by_address(
+            address="test",
+            startblock=1,
+            endblock=2,
+            page=1,
+            offset=1,
+            sort="asc",
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "txlist",
+                "address": "test",
+                "startblock": 1,
+                "endblock": 2,
+                "page": 1,
+                "offset": 1,
+                "sort": "asc",
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_internal_transactions_by_address(self, mock_get):
+    def test_get_internal_transactions_by_address(self):
         address = "test"
         startblock = 1
         endblock = 2
@@ -129,7 +545,8 @@ class EtherscanTestCase(TestCase):
             offset=offset,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "txlistinternal",
@@ -137,25 +554,47 @@ class EtherscanTestCase(TestCase):
                 "startblock": startblock,
                 "endblock": endblock,
                 "page": page,
-                "offsetoffset": offset,
+                "offset": offset,
                 "sort": sort,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_internal_transactions_by_address(self, mock_get_stream):
+        self.api.iter_internal_transactions_by_address(
+            address="test",
+            startblock=1,
+            endblock=2,
+            page=1,
+            offset=1,
+            sort="asc",
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "txlistinternal",
+                "address": "test",
+                "startblock": 1,
+                "endblock": 2,
+                "page": 1,
+                "offset": 1,
+                "sort": "asc",
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_internal_transactions_by_hash(self, mock_get):
+    def test_get_internal_transactions_by_hash(self):
         txhash = "test"
         self.api.get_internal_transactions_by_hash(txhash=txhash)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "txlistinternal",
                 "txhash": txhash,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_internal_transactions_by_block_range(self, mock_get):
+    def test_get_internal_transactions_by_block_range(self):
         startblock = 1
         endblock = 2
         page = 1
@@ -168,20 +607,37 @@ class EtherscanTestCase(TestCase):
             offset=offset,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "txlistinternal",
                 "startblock": startblock,
                 "endblock": endblock,
                 "page": page,
-                "offsetoffset": offset,
+                "offset": offset,
                 "sort": sort,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_internal_transactions_by_block_range(self, mock_get_stream):
+        self.api.iter_internal_transactions_by_block_range(
+            startblock=1, endblock=2, page=1, offset=1, sort="asc"
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "txlistinternal",
+                "startblock": 1,
+                "endblock": 2,
+                "page": 1,
+                "offset": 1,
+                "sort": "asc",
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_erc20_token_transferred_by_address(self, mock_get):
+    def test_get_erc20_token_transferred_by_address(self):
         address = "test"
         contractaddress = "test"
         page = 1
@@ -198,7 +654,8 @@ class EtherscanTestCase(TestCase):
             endblock=endblock,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "tokentx",
@@ -209,11 +666,35 @@ class EtherscanTestCase(TestCase):
                 "startblock": startblock,
                 "endblock": endblock,
                 "sort": sort,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_erc20_token_transferred_by_address(self, mock_get_stream):
+        self.api.iter_erc20_token_transferred_by_address(
+            contractaddress="test",
+            address="test",
+            page=1,
+            offset=1,
+            startblock=1,
+            endblock=1,
+            sort="asc",
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "tokentx",
+                "contractaddress": "test",
+                "address": "test",
+                "page": 1,
+                "offset": 1,
+                "startblock": 1,
+                "endblock": 1,
+                "sort": "asc",
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_erc721_token_transferred_by_address(self, mock_get):
+    def test_get_erc721_token_transferred_by_address(self):
         address = "test"
         contractaddress = "test"
         page = 1
@@ -230,7 +711,8 @@ class EtherscanTestCase(TestCase):
             endblock=endblock,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "tokennfttx",
@@ -241,11 +723,35 @@ class EtherscanTestCase(TestCase):
                 "startblock": startblock,
                 "endblock": endblock,
                 "sort": sort,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_erc721_token_transferred_by_address(self, mock_get_stream):
+        self.api.iter_erc721_token_transferred_by_address(
+            contractaddress="test",
+            address="test",
+            page=1,
+            offset=1,
+            startblock=1,
+            endblock=1,
+            sort="asc",
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "tokennfttx",
+                "contractaddress": "test",
+                "address": "test",
+                "page": 1,
+                "offset": 1,
+                "startblock": 1,
+                "endblock": 1,
+                "sort": "asc",
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_blocks_mined_by_address(self, mock_get):
+    def test_get_blocks_mined_by_address(self):
         address = "test"
         blocktype = "test"
         page = 1
@@ -253,7 +759,8 @@ class EtherscanTestCase(TestCase):
         self.api.get_blocks_mined_by_address(
             address=address, blocktype=blocktype, page=page, offset=offset
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "account",
                 "action": "getminedblocks",
@@ -261,250 +768,260 @@ class EtherscanTestCase(TestCase):
                 "blocktype": blocktype,
                 "page": page,
                 "offset": offset,
+            },
+        )
+
+    @mock.patch("etherscan.etherscan.Etherscan._get_stream")
+    def test_iter_blocks_mined_by_address(self, mock_get_stream):
+        self.api.iter_blocks_mined_by_address(
+            address="test", blocktype="blocks", page=1, offset=1
+        )
+        mock_get_stream.assert_called_once_with(
+            params={
+                "module": "account",
+                "action": "getminedblocks",
+                "address": "test",
+                "blocktype": "blocks",
+                "page": 1,
+                "offset": 1,
             }
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_abi_verified_smart_contract(self, mock_get):
+    def test_get_abi_verified_smart_contract(self):
         address = "test"
         self.api.get_abi_verified_smart_contract(address=address)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "contract",
                 "action": "getabi",
                 "address": address,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_source_code_smart_contract(self, mock_get):
+    def test_get_source_code_smart_contract(self):
         address = "test"
         self.api.get_source_code_smart_contract(address=address)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "contract",
                 "action": "getsourcecode",
                 "address": address,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_contract_execution_status(self, mock_get):
+    def test_get_contract_execution_status(self):
         txhash = "test"
         self.api.get_contract_execution_status(txhash=txhash)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "transaction",
                 "action": "getstatus",
                 "txhash": txhash,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_transaction_execution_status(self, mock_get):
+    def test_get_transaction_execution_status(self):
         txhash = "test"
         self.api.get_transaction_execution_status(txhash=txhash)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "transaction",
                 "action": "gettxreceiptstatus",
                 "txhash": txhash,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_block_uncleblock_reward_by_blockno(self, mock_get):
+    def test_get_block_uncleblock_reward_by_blockno(self):
         blockno = 1
         self.api.get_block_uncleblock_reward_by_blockno(blockno=blockno)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "block",
                 "action": "getblockreward",
                 "blockno": blockno,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_estimate_mined_countdown_by_blockno(self, mock_get):
+    def test_get_estimate_mined_countdown_by_blockno(self):
         blockno = 1
         self.api.get_estimate_mined_countdown_by_blockno(blockno=blockno)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "block",
                 "action": "getblockcountdown",
                 "blockno": blockno,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_block_number_by_tymestamp(self, mock_get):
+    def test_get_block_number_by_tymestamp(self):
         timestamp = 1
         self.api.get_block_number_by_tymestamp(timestamp=timestamp)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "block",
                 "action": "getblocknobytime",
                 "timestamp": timestamp,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_no_most_recent_block(self, mock_get):
+    def test_get_no_most_recent_block(self):
         self.api.get_no_most_recent_block()
-        mock_get.assert_called_once_with(
-            params={"module": "proxy", "action": "eth_blockNumber"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "proxy", "action": "eth_blockNumber"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_block_by_number(self, mock_get):
+    def test_get_block_by_number(self):
         tag = "test"
         boolean = True
         self.api.get_block_by_number(tag=tag, boolean=boolean)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getblockbynumber",
                 "tag": tag,
                 "boolean": boolean,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_uncle_by_block_number(self, mock_get):
+    def test_get_uncle_by_block_number(self):
         tag = "test"
         index = 1
         self.api.get_uncle_by_block_number(tag=tag, index=index)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getUncleByBlockNumberAndIndex",
                 "tag": tag,
                 "index": index,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_number_transaction_in_block(self, mock_get):
+    def test_get_number_transaction_in_block(self):
         tag = "test"
         self.api.get_number_transaction_in_block(tag=tag)
-        mock_get.assert_called_with(
+        self.mock_get.assert_called_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getBlockTransactionCountByNumber",
                 "tag": tag,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_transaction_by_hash(self, mock_get):
+    def test_get_transaction_by_hash(self):
         txhash = "test"
         self.api.get_transaction_by_hash(txhash=txhash)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getTransactionByHash",
                 "txhash": txhash,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_transaction_by_blocknumber_and_index(self, mock_get):
+    def test_get_transaction_by_blocknumber_and_index(self):
         tag = "test"
         index = 1
         self.api.get_transaction_by_blocknumber_and_index(tag=tag, index=index)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getTransactionByBlockNumberAndIndex",
                 "tag": tag,
                 "index": index,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_count_transactions_by_address(self, mock_get):
+    def test_get_count_transactions_by_address(self):
         address = "test"
         tag = "test"
         self.api.get_count_transactions_by_address(address=address, tag=tag)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getTransactionCount",
                 "address": address,
                 "tag": tag,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_receipt_by_transaction_hash(self, mock_get):
+    def test_get_receipt_by_transaction_hash(self):
         txhash = "test"
         self.api.get_receipt_by_transaction_hash(txhash=txhash)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "proxy",
                 "action": "eth_getTransactionReceipt",
                 "txhash": txhash,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_gas_price(self, mock_get):
+    def test_get_gas_price(self):
         self.api.get_gas_price()
-        mock_get.assert_called_once_with(
-            params={"module": "proxy", "action": "eth_gasPrice"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "proxy", "action": "eth_gasPrice"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_erc20_in_circulation(self, mock_get):
+    def test_get_erc20_in_circulation(self):
         contractaddress = "test"
         self.api.get_erc20_in_circulation(contractaddress=contractaddress)
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "stats",
                 "action": "tokensupply",
                 "contractaddress": contractaddress,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_erc20_balance_of_address(self, mock_get):
+    def test_get_erc20_balance_of_address(self):
         contractaddress = "test"
         address = "test"
         self.api.get_erc20_balance_of_address(
             contractaddress=contractaddress, address=address
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "stats",
                 "action": "tokenbalance",
                 "contractaddress": contractaddress,
                 "address": address,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_ether_supply(self, mock_get):
+    def test_get_ether_supply(self):
         self.api.get_ether_supply()
-        mock_get.assert_called_once_with(
-            params={"module": "stats", "action": "ethsupply"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "stats", "action": "ethsupply"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_eth2_supply(self, mock_get):
+    def test_get_eth2_supply(self):
         self.api.get_eth2_supply()
-        mock_get.assert_called_once_with(
-            params={"module": "stats", "action": "ethsupply2"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "stats", "action": "ethsupply2"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_ether_last_price(self, mock_get):
+    def test_get_ether_last_price(self):
         self.api.get_ether_last_price()
-        mock_get.assert_called_once_with(
-            params={"module": "stats", "action": "ethprice"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "stats", "action": "ethprice"}
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_nodes_size(self, mock_get):
+    def test_get_nodes_size(self):
         startdate = "test"
         enddate = "test"
         clienttype = "test"
@@ -517,7 +1034,8 @@ class EtherscanTestCase(TestCase):
             syncmode=syncmode,
             sort=sort,
         )
-        mock_get.assert_called_once_with(
+        self.mock_get.assert_called_once_with(
+            self.api,
             params={
                 "module": "stats",
                 "action": "chainsize",
@@ -526,12 +1044,23 @@ class EtherscanTestCase(TestCase):
                 "clienttype": clienttype,
                 "syncmode": syncmode,
                 "sort": sort,
-            }
+            },
         )
 
-    @mock.patch("etherscan.etherscan.Etherscan._get")
-    def test_get_total_nodes_count(self, mock_get):
+    def test_get_total_nodes_count(self):
         self.api.get_total_nodes_count()
-        mock_get.assert_called_once_with(
-            params={"module": "stats", "action": "nodecount"}
+        self.mock_get.assert_called_once_with(
+            self.api, params={"module": "stats", "action": "nodecount"}
+        )
+
+    def test_call(self):
+        self.api._call("account", "balance", address="test", tag="latest")
+        self.mock_get.assert_called_once_with(
+            self.api,
+            params={
+                "module": "account",
+                "action": "balance",
+                "address": "test",
+                "tag": "latest",
+            },
         )
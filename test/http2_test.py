@@ -0,0 +1,100 @@
+from unittest import IsolatedAsyncioTestCase, mock
+
+import httpx
+
+from etherscan.etherscan import EtherscanAPIError
+from etherscan.http2 import HttpxEtherscan
+
+
+def mock_response(status_code=200, content=b"{}"):
+    return httpx.Response(
+        status_code,
+        content=content,
+        request=httpx.Request("GET", HttpxEtherscan.BASE_URL),
+    )
+
+
+class HttpxEtherscanTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.api = HttpxEtherscan(key="123test", plan="free")
+        await self.api.__aenter__()
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    @mock.patch("httpx.AsyncClient")
+    async def test_aenter(self, mock_client):
+        mock_client.return_value.aclose = mock.AsyncMock()
+        api = HttpxEtherscan(key="123test", concurrency=3)
+        async with api:
+            self.assertIs(api._session, mock_client.return_value)
+        mock_client.return_value.aclose.assert_awaited_once()
+        self.assertTrue(mock_client.call_args.kwargs["http2"])
+        self.assertEqual(
+            mock_client.call_args.kwargs["limits"].max_connections, 3
+        )
+
+    async def test_get(self):
+        with mock.patch.object(
+            self.api._session, "get", return_value=mock_response()
+        ) as mock_get:
+            self.assertEqual(await self.api._get(), {})
+        mock_get.assert_awaited_once_with(
+            "https://api.etherscan.io/api?apikey=123test"
+        )
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_404_status(self, mock_log):
+        response = mock_response(404, content=b"404 Not Found Message")
+        with mock.patch.object(self.api._session, "get", return_value=response):
+            with self.assertRaises(EtherscanAPIError) as context:
+                await self.api._get()
+        self.assertEqual("404 404 Not Found Message", str(context.exception))
+        mock_log.assert_called_once()
+
+    @mock.patch("asyncio.sleep")
+    async def test_get_retry_connection_error(self, mock_sleep):
+        side_effect = (httpx.ConnectError("test"), mock_response())
+        with mock.patch.object(
+            self.api._session, "get", side_effect=side_effect
+        ) as mock_get:
+            self.assertEqual(await self.api._get(), {})
+        self.assertEqual(mock_get.await_count, 2)
+
+    @mock.patch.object(HttpxEtherscan, "STREAM_MIN_SIZE", 0)
+    async def test_get_stream(self):
+        content = b'{"status": "1", "result": [{"a": 1}, {"b": 2.5}]}'
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=content)
+        )
+        await self.api.close()
+        self.api._session = httpx.AsyncClient(transport=transport)
+        items = self.api.iter_normal_transactions_by_address(address="a")
+        self.assertEqual([item async for item in items], [{"a": 1}, {"b": 2.5}])
+
+    @mock.patch.object(HttpxEtherscan, "STREAM_MIN_SIZE", 0)
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_stream_error_message(self, mock_log):
+        content = b'{"status": "0", "result": "Invalid API Key"}'
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=content)
+        )
+        await self.api.close()
+        self.api._session = httpx.AsyncClient(transport=transport)
+        with self.assertRaises(EtherscanAPIError):
+            [item async for item in self.api._get_stream()]
+
+    @mock.patch("etherscan.etherscan.logger.warning")
+    async def test_get_stream_404_status(self, mock_log):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(404, content=b"Not Found")
+        )
+        await self.api.close()
+        self.api._session = httpx.AsyncClient(transport=transport)
+        with self.assertRaises(EtherscanAPIError) as context:
+            [item async for item in self.api._get_stream()]
+        self.assertEqual("404 Not Found", str(context.exception))
+
+    async def test_close(self):
+        await self.api.close()
+        self.assertIsNone(self.api._session)
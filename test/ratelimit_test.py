@@ -0,0 +1,37 @@
+from unittest import mock
+
+from etherscan.ratelimit import TokenBucket
+
+
+@mock.patch("time.monotonic", return_value=0)
+def test_reserve(mock_time):
+    bucket = TokenBucket(rate=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1
+    mock_time.return_value = 10
+    assert bucket.reserve() == 0
+
+
+@mock.patch("time.monotonic", return_value=0)
+def test_capacity(mock_time):
+    bucket = TokenBucket(rate=1, capacity=3)
+    mock_time.return_value = 100
+    for _ in range(3):
+        assert bucket.reserve() == 0
+    assert bucket.reserve() == 1
+
+
+@mock.patch("time.sleep")
+@mock.patch("time.monotonic", return_value=0)
+def test_consume(mock_time, mock_sleep):
+    bucket = TokenBucket(rate=1)
+    bucket.consume()
+    mock_sleep.assert_not_called()
+    bucket.consume()
+    mock_sleep.assert_called_once_with(1)
+
+
+def test_slots():
+    assert not hasattr(TokenBucket(rate=1), "__dict__")
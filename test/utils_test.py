@@ -1,6 +1,17 @@
+import importlib
+import json
+import sys
+from unittest import mock
+
+import pytest
+
+import etherscan.utils
 from etherscan.utils import (
+    chunks,
     clean_dict_values,
     clean_params,
+    clean_value,
+    merge_results,
     remove_empty_dict_values,
 )
 
@@ -21,6 +32,12 @@ def test_clean_dict_values():
     assert new_dict["f"] == "foo,bar"
 
 
+def test_clean_value():
+    assert clean_value(False) == "false"
+    assert clean_value([1, "a"]) == "1,a"
+    assert clean_value(0) == 0
+
+
 def test_clean_params():
     new_dict = clean_params({"a": None, "b": ["foo", "bar"], "c": True})
     assert "a" not in new_dict
@@ -31,3 +48,40 @@ def test_clean_params():
 def test_clean_params_empty():
     new_dict = clean_params(None)
     assert new_dict is None
+
+
+def test_clean_params_does_not_mutate():
+    params = {"a": None, "b": ["foo", "bar"]}
+    clean_params(params)
+    assert params == {"a": None, "b": ["foo", "bar"]}
+
+
+def test_chunks():
+    assert chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunks([], 2) == []
+
+
+def test_merge_results():
+    responses = [
+        {"status": "1", "result": [1, 2]},
+        None,
+        {"status": "0", "result": "Error! Invalid address format"},
+        {"status": "1", "result": [3]},
+    ]
+    assert merge_results(responses) == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "missing, fallback", [(("orjson",), "ujson"), (("orjson", "ujson"), "json")]
+)
+def test_json_fallback(missing, fallback):
+    module = pytest.importorskip(fallback)
+    try:
+        with mock.patch.dict(sys.modules, dict.fromkeys(missing)):
+            utils = importlib.reload(etherscan.utils)
+        assert utils.loads is module.loads
+        assert utils.dumps is module.dumps
+        assert utils.loads(b'{"a": 1}') == {"a": 1}
+        assert json.loads(utils.dumps({"a": 1})) == {"a": 1}
+    finally:
+        importlib.reload(etherscan.utils)